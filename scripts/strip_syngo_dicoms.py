@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import os.path as op
 from operator import itemgetter
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import re
 import argparse
 import pydicom
@@ -20,6 +22,14 @@ args = parser.parse_args()
 
 ENHANCED_MR_STORAGE = '1.2.840.10008.5.1.4.1.1.4.1'
 
+# Only the SOP class UID is checked so it is the only element that needs to
+# be read from the main dataset
+READ_TAGS = [pydicom.tag.Tag(0x0008, 0x0016)]  # SOPClassUID
+
+# Only the header is inspected so skip reading the pixel data
+read_header = partial(pydicom.dcmread, stop_before_pixels=True,
+                      specific_tags=READ_TAGS)
+
 
 with xnatutils.connect() as xlogin:
     
@@ -36,11 +46,14 @@ with xnatutils.connect() as xlogin:
                                             xscan.type)),
             'resources', 'DICOM', 'files')
         
-        for fname, xfile in sorted(xscan.files.items(), key=itemgetter(0)):
-            fpath = op.join(files_path, fname)
-            with open(fpath, 'rb') as f:
-                dcm = pydicom.dcmread(fpath)
-            if dcm.file_meta.MediaStorageSOPClassUID == ENHANCED_MR_STORAGE:
+        xfiles = sorted(xscan.files.items(), key=itemgetter(0))
+        # Read the headers in parallel to overlap the file I/O
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            dcms = list(executor.map(
+                read_header, (op.join(files_path, f) for f, _ in xfiles)))
+
+        for (fname, xfile), dcm in zip(xfiles, dcms):
+            if dcm.SOPClassUID == ENHANCED_MR_STORAGE:
                 print("Deleting '{}".format(fname))
                 if not args.dry_run:
                     xfile.delete()
@@ -31,14 +31,13 @@ setup(
     install_requires=['xnat>=0.3.17',
                       'progressbar2>=3.16.0',
                       'future>=0.16'],
-    python_requires='>=3.4',
+    python_requires='>=3.5',
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Healthcare Industry",
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: Apache Software License",
         "Natural Language :: English",
-        "Programming Language :: Python :: 3.4",
         "Programming Language :: Python :: 3.5",
         "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
@@ -1,7 +1,7 @@
 import os
 import shutil
 import tempfile
-from unittest import TestCase
+from unittest import TestCase, mock
 from xnatutils import get
 
 
@@ -60,3 +60,33 @@ class XnatGetTest(TestCase):
         get('MMH008_CON007_MRPT01', tmpdir, scans='JPG_.*')
         get('MMH008_CON007_MRPT01', tmpdir, scans='Localiser')
         print(os.listdir(os.path.join(tmpdir, 'MMH008_CON007_MRPT01')))
+
+    def test_multiple_resources(self):
+        # All resources of every scan should be downloaded when no
+        # resource_name is given, not just those of the first scan
+        def make_scan(scan_id, labels):
+            resources = {}
+            for label in labels:
+                resource = mock.Mock(uri='{}/{}'.format(scan_id, label))
+                resource.label = label
+                resources[label] = resource
+            return mock.Mock(id=scan_id, type='scan' + scan_id,
+                             resources=resources)
+
+        session = mock.Mock()
+        session.label = 'TEST001_001_MR01'
+        scans = [make_scan('1', ['DICOM', 'NIFTI']),
+                 make_scan('2', ['DICOM', 'NIFTI', 'MRTRIX'])]
+        tmpdir = tempfile.mkdtemp()
+        with mock.patch('xnatutils.get_.connect'), \
+                mock.patch('xnatutils.get_.matching_sessions',
+                           return_value=[session]), \
+                mock.patch('xnatutils.get_.matching_scans',
+                           return_value=scans), \
+                mock.patch('xnatutils.get_._download_resource') as download:
+            downloaded = get(session.label, tmpdir)
+        self.assertEqual(
+            sorted(downloaded[session.label]),
+            ['1/DICOM', '1/NIFTI', '2/DICOM', '2/MRTRIX', '2/NIFTI'])
+        self.assertTrue(all(c[1]['suffix'] for c in download.call_args_list))
+        shutil.rmtree(tmpdir)
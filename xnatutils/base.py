@@ -56,6 +56,8 @@ session_modality_re = re.compile(r'\w+_\w+_([A-Z]+)\d+')
 
 server_name_re = re.compile(r'(https?://)?([\w\-\.]+).*')
 
+response_status_re = re.compile(r'\(status (\d+)\)')
+
 
 def connect(server=None, user=None, loglevel='ERROR', connection=None,
             use_netrc=True, failures=0, password=None):
@@ -255,7 +257,7 @@ def list_results(login, path, attr):
     try:
         response = login.get_json('/data/archive/' + '/'.join(path))
     except XNATResponseError as e:
-        match = re.search(r'\(status (\d+)\)', str(e))
+        match = response_status_re.search(str(e))
         if match:
             status_code = int(match.group(1))
         else:
@@ -273,31 +275,31 @@ def list_results(login, path, attr):
 
 
 def _unpack_response(response_part, types):
-    if isinstance(response_part, dict):
-        if 'children' in response_part:
-            value = response_part['children']
-        elif 'items' in response_part:
-            value = response_part['items']
-            if not types:
-                return value  # End recursion
+    # Walk down the nested response iteratively instead of recursing
+    while True:
+        if isinstance(response_part, dict):
+            if 'children' in response_part:
+                response_part = response_part['children']
+            elif 'items' in response_part:
+                response_part = response_part['items']
+                if not types:
+                    return response_part  # End traversal
+            else:
+                assert False
+        elif isinstance(response_part, list):
+            if len(response_part) == 1:
+                response_part = response_part[0]
+            else:
+                try:
+                    response_part = next(i for i in response_part
+                                         if i['field'].startswith(types[0]))
+                except StopIteration:
+                    assert False, (
+                        "Did not find '{}' in {}, even though search "
+                        "returned results")
+            types = types[1:]
         else:
             assert False
-        unpacked = _unpack_response(value, types)
-    elif isinstance(response_part, list):
-        if len(response_part) == 1:
-            item = response_part[0]
-        else:
-            try:
-                item = next(i for i in response_part
-                            if i['field'].startswith(types[0]))
-            except StopIteration:
-                assert False, (
-                    "Did not find '{}' in {}, even though search "
-                    "returned results")
-        unpacked = _unpack_response(item, types[1:])
-    else:
-        assert False
-    return unpacked
 
 
 def matching_subjects(base, subject_ids, project_id=None):
@@ -315,9 +317,9 @@ def matching_subjects(base, subject_ids, project_id=None):
                 "project_id (\"-p\") must be provided to use empty IDs string")
         subjects = base.subjects.values()
     elif is_regex(subject_ids):
+        subject_res = _compile_full_match(subject_ids)
         subjects = [s for s in base.subjects.values()
-                    if any(re.match(i + '$', s.label)
-                           for i in subject_ids)]
+                    if any(r.match(s.label) for r in subject_res)]
     else:
         subjects = set()
         for id_ in subject_ids:
@@ -378,6 +380,9 @@ def matching_sessions(login, session_ids, with_scans=None,
         without_scans = [without_scans]
     elif without_scans is None:
         without_scans = ()
+    # Compile the scan patterns once instead of for every session
+    with_scan_res = _compile_full_match(with_scans)
+    without_scan_res = _compile_full_match(without_scans)
 
     def valid(session):
         if before is not None and session.date > before:
@@ -387,11 +392,11 @@ def matching_sessions(login, session_ids, with_scans=None,
         if with_scans or without_scans:
             scans = [(s.type if s.type is not None else s.id)
                      for s in session.scans.values()]
-            for scan_type in with_scans:
-                if not any(re.match(scan_type + '$', s) for s in scans):
+            for scan_type_re in with_scan_res:
+                if not any(scan_type_re.match(s) for s in scans):
                     return False
-            for scan_type in without_scans:
-                if any(re.match(scan_type + '$', s) for s in scans):
+            for scan_type_re in without_scan_res:
+                if any(scan_type_re.match(s) for s in scans):
                     return False
         return True
 
@@ -423,9 +428,9 @@ def matching_sessions(login, session_ids, with_scans=None,
                 "project_id (\"-p\") must be provided to use empty IDs string")
         sessions = set(base.experiments.values())
     elif is_regex(session_ids):
+        session_res = _compile_full_match(session_ids)
         sessions = set(s for s in base.experiments.values()
-                       if any(re.match(i + '$', s.label)
-                              for i in session_ids))
+                       if any(r.match(s.label) for r in session_res))
     else:
         sessions = set()
         for id_ in session_ids:
@@ -463,11 +468,19 @@ def matching_scans(session, scan_types, match_id=True):
         return label
     matches = session.scans.values()
     if scan_types is not None:
+        scan_type_res = _compile_full_match(scan_types)
         matches = (s for s in matches if any(
-            re.match(i + '$', label(s)) for i in scan_types))
+            r.match(label(s)) for r in scan_type_res))
     return sorted(matches, key=label)
 
 
+def _compile_full_match(patterns):
+    """
+    Compiles regex patterns that are required to match the whole string
+    """
+    return [re.compile(p + '$') for p in patterns]
+
+
 def find_executable(name):
     """
     Finds the location of an executable on the system path
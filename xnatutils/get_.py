@@ -15,7 +15,7 @@ from .base import (
     sanitize_re, skip_resources, resource_exts, find_executable, is_regex,
     base_parser, add_default_args, print_response_error, print_usage_error,
     print_info_message, set_logger, matching_sessions, matching_scans,
-    connect)
+    connect, response_status_re)
 from .exceptions import (
     XnatUtilsUsageError, XnatUtilsMissingResourceException,
     XnatUtilsSkippedAllSessionsException, XnatUtilsException)
@@ -152,10 +152,11 @@ def get(session, download_dir, scans=None, resource_name=None,
     if isinstance(scans, str):
         scans = [scans]
     if skip_downloaded:
-        skip = [d for d in os.listdir(download_dir)
-                if os.path.isdir(os.path.join(download_dir, d))]
+        # Use the entry types returned by scandir to avoid a stat per entry
+        # and store the names in a set for quick membership checks
+        skip = set(e.name for e in os.scandir(download_dir) if e.is_dir())
     else:
-        skip = []
+        skip = set()
     # Quickly skip session if not using regex (and therefore don't need to
     # connect to XNAT
     if session and all((not is_regex(s) and s in skip) for s in session):
@@ -187,20 +188,20 @@ def get(session, download_dir, scans=None, resource_name=None,
                             continue
                     resources.append(resource)
                 else:
-                    resource_names = [
-                        r.label for r in scan.resources.values()
+                    # Keep the resource objects from the listing rather
+                    # than looking each one up again by its label
+                    resources = [
+                        r for r in scan.resources.values()
                         if r.label not in skip_resources]
-                    if not resource_names:
+                    if not resources:
                         logger.warning(
                             ("No valid scan formats for '%s-%s' in '%s' "
                              "(found '%s')"),
                             scan.id, scan.type, session,
                             "', '".join(scan.resources))
                         continue
-                    if len(resource_names) > 1:
+                    if len(resources) > 1:
                         suffix = True
-                    for resource_name in resource_names:
-                        resources.append(scan.resources[resource_name])
                 for resource in resources:
                     _download_resource(
                         resource, scan, session, download_dir, subject_dirs,
@@ -299,15 +300,9 @@ def get_from_xml(xml_file_path, download_dir, convert_to=None, converter=None,
 
 
 def get_extension(resource_name):
-    ext = ''
-    try:
-        ext = resource_exts[resource_name]
-    except KeyError:
-        try:
-            ext = resource_exts[resource_name.upper()]
-        except KeyError:
-            pass
-    return ext
+    if resource_name in resource_exts:
+        return resource_exts[resource_name]
+    return resource_exts.get(resource_name.upper(), '')
 
 # def download_fileset(self, tmp_dir, xresource, fileset, cache_path):
 #     # Download resource to zip file
@@ -387,8 +382,7 @@ def _download_resource(resource, scan, session, download_dir, subject_dirs,
     except XNATResponseError as e:
         # Check for 404 status
         try:
-            status = int(
-                re.match(r'.*\(status (\d+)\).*', str(e)).group(1))
+            status = int(response_status_re.search(str(e)).group(1))
             if status == 404:
                 logger.warning(
                     "Did not find any files for resource '%s' in '%s' "
@@ -454,16 +448,14 @@ def _download_resource(resource, scan, session, download_dir, subject_dirs,
             # mrconvert can do this as well but there have been
             # some problems losing TR from the dicom header.
             zip_opt = 'y' if convert_to == 'nifti_gz' else 'n'
-            convert_cmd = '{} -z {} -o "{}" -f "{}" "{}"'.format(
-                dcm2niix, zip_opt, target_dir,
+            sp.check_call([
+                dcm2niix, '-z', zip_opt, '-o', target_dir, '-f',
                 (scan_label if scan is not None else resource.label),
-                src_path)
-            sp.check_call(convert_cmd, shell=True)
+                src_path])
         elif converter == 'mrtrix':
             # If dcm2niix format is not installed or another is
             # required use mrconvert instead.
-            sp.check_call('{} "{}" "{}"'.format(
-                mrconvert, src_path, target_path), shell=True)
+            sp.check_call([mrconvert, src_path, target_path])
         else:
             if (resource.label == 'DICOM' and convert_to in ('nifti',
                                                              'nifti_gz')):
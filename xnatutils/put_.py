@@ -1,6 +1,7 @@
 import sys
 import os.path
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from xnat.exceptions import XNATResponseError
 from .base import (
     sanitize_re, illegal_scan_chars_re, get_resource_name,
@@ -192,27 +193,34 @@ def put(session, scan, *filenames, **kwargs):
             print("{} uploaded to {}:{}".format(
                 fname, session, scan))
         print("Uploaded files, checking digests...")
-        # Check uploaded files checksums
+        # Check uploaded files checksums, calculating the local digests
+        # of multiple files in parallel (hashlib releases the GIL)
         remote_digests = get_digests(resource)
-        for fname in filenames:
-            remote_digest = remote_digests[
-                os.path.basename(fname).replace(' ', '%20')]
-            local_digest = calculate_checksum(fname)
-            if local_digest != remote_digest:
-                raise XnatUtilsDigestCheckError(
-                    "Remote digest does not match local ({} vs {}) "
-                    "for {}. Please upload your datasets again"
-                    .format(remote_digest, local_digest, fname))
-            print("Successfully checked digest for {}".format(
-                  fname, session, scan))
+        max_workers = max(min(len(filenames), os.cpu_count() or 1), 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            local_digests = executor.map(calculate_checksum, filenames)
+            for fname, local_digest in zip(filenames, local_digests):
+                remote_digest = remote_digests[
+                    os.path.basename(fname).replace(' ', '%20')]
+                if local_digest != remote_digest:
+                    raise XnatUtilsDigestCheckError(
+                        "Remote digest does not match local ({} vs {}) "
+                        "for {}. Please upload your datasets again"
+                        .format(remote_digest, local_digest, fname))
+                print("Successfully checked digest for {}".format(
+                      fname, session, scan))
 
 
 def calculate_checksum(fname):
     try:
         file_hash = hashlib.md5()
+        # Read into a single reusable buffer instead of allocating a new
+        # bytes object for every chunk
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
         with open(fname, 'rb') as f:
-            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
-                file_hash.update(chunk)
+            for nbytes in iter(lambda: f.readinto(buf), 0):
+                file_hash.update(view[:nbytes])
         return file_hash.hexdigest()
     except OSError:
         raise XnatUtilsDigestCheckFailedError(